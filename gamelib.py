@@ -12,6 +12,8 @@ class GameElement(ABC):
     be displayed on the game's screen
     """
 
+    __slots__ = ("__game", "__x", "__y")
+
     def __init__(self, game: "Game"):
         self.__game: "Game" = game
         self.__x: float = 0
@@ -154,6 +156,12 @@ class Game(tk.Frame, ABC): # pylint: disable=too-many-ancestors
         """
         self.__started = False
 
+    def post_animate(self) -> None:
+        """
+        Get called once per frame after all game's elements have been updated
+        and rendered
+        """
+
     def animate(self):
         """
         Update and render all game's elements
@@ -161,5 +169,6 @@ class Game(tk.Frame, ABC): # pylint: disable=too-many-ancestors
         for element in self.__game_elements:
             element.update()
             element.render()
+        self.post_animate()
         if self.__started:
             self.after(self.__update_delay, self.animate)
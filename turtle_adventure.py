@@ -6,11 +6,71 @@ import random
 import os
 import math
 import tkinter as tk
-from turtle import RawTurtle
-from PIL import Image, ImageTk
+from typing import Union
+from turtle import RawTurtle, TurtleScreen
+from PIL import Image, ImageDraw, ImageTk
 from gamelib import Game, GameElement
 
 
+# speed factors picked at random whenever a DemoEnemy bounces off a border
+_JITTER = (1.0, 1.1)
+
+# half the side of the square fence that FencingEnemy walks around the home,
+# and the length of one lap around it
+_FENCE_HALF = 20
+_FENCE_LAP = 8 * _FENCE_HALF
+# for each side of the fence, in walking order: the corner it starts from, in
+# units of _FENCE_HALF relative to home, and the direction along it
+_FENCE_SIDES = ((1, 1, 0, -1),    # right side, going up
+                (1, -1, -1, 0),   # top side, going left
+                (-1, -1, 0, 1),   # left side, going down
+                (-1, 1, 1, 0))    # bottom side, going right
+
+# shared sprites, keyed by file path for images loaded from files and by
+# (shape, size, color) for drawn shapes
+_SPRITE_CACHE: dict[Union[str, tuple[str, int, str]], ImageTk.PhotoImage] = {}
+
+
+def _file_sprite(path: str) -> ImageTk.PhotoImage:
+    """
+    Get a shared image loaded from the given file, loading it on first use
+    """
+    sprite = _SPRITE_CACHE.get(path)
+    if sprite is None:
+        sprite = ImageTk.PhotoImage(Image.open(path))
+        _SPRITE_CACHE[path] = sprite
+    return sprite
+
+
+def _shape_sprite(shape: str, size: int, color: str) -> ImageTk.PhotoImage:
+    """
+    Get a shared image of a filled, black-outlined "oval" or "rectangle" of
+    the given size and color, creating it on first use
+    """
+    key = (shape, size, color)
+    sprite = _SPRITE_CACHE.get(key)
+    if sprite is None:
+        image = Image.new("RGBA", (size+1, size+1), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(image)
+        if shape == "oval":
+            draw.ellipse((0, 0, size, size), fill=color, outline="black")
+        elif shape == "rectangle":
+            draw.rectangle((0, 0, size, size), fill=color, outline="black")
+        else:
+            raise ValueError(f"unknown sprite shape: {shape!r}")
+        sprite = ImageTk.PhotoImage(image)
+        _SPRITE_CACHE[key] = sprite
+    return sprite
+
+
+def _step_towards(pos: float, target: float, step: float) -> float:
+    """
+    Move a coordinate towards the target by at most the given step
+    """
+    if target > pos:
+        return min(pos + step, target)
+    return max(pos - step, target)
+
 
 class TurtleGameElement(GameElement):
     """
@@ -18,6 +78,8 @@ class TurtleGameElement(GameElement):
     Adventure game
     """
 
+    __slots__ = ("__game",)
+
     def __init__(self, game: "TurtleAdventureGame"):
         super().__init__(game)
         self.__game: "TurtleAdventureGame" = game
@@ -35,6 +97,8 @@ class Waypoint(TurtleGameElement):
     Represent the waypoint to which the player will move.
     """
 
+    __slots__ = ("__id1", "__id2", "__active")
+
     def __init__(self, game: "TurtleAdventureGame"):
         super().__init__(game)
         self.__id1: int
@@ -92,10 +156,13 @@ class Home(TurtleGameElement):
     Represent the player's home.
     """
 
+    __slots__ = ("__id", "__size", "__half")
+
     def __init__(self, game: "TurtleAdventureGame", pos: tuple[int, int], size: int):
         super().__init__(game)
         self.__id: int
         self.__size: int = size
+        self.__half: float = size/2
         x, y = pos
         self.x = x
         self.y = y
@@ -110,6 +177,7 @@ class Home(TurtleGameElement):
     @size.setter
     def size(self, val: int) -> None:
         self.__size = val
+        self.__half = val/2
 
     def create(self) -> None:
         self.__id = self.canvas.create_rectangle(0, 0, 0, 0, outline="brown", width=2)
@@ -132,9 +200,8 @@ class Home(TurtleGameElement):
         """
         Check whether home contains the point (x, y).
         """
-        x1, x2 = self.x-self.size/2, self.x+self.size/2
-        y1, y2 = self.y-self.size/2, self.y+self.size/2
-        return x1 <= x <= x2 and y1 <= y <= y2
+        half = self.__half
+        return abs(x - self.x) <= half and abs(y - self.y) <= half
 
 
 class Player(TurtleGameElement):
@@ -142,6 +209,8 @@ class Player(TurtleGameElement):
     Represent the main player, implemented using Python's turtle.
     """
 
+    __slots__ = ("__speed", "__turtle")
+
     def __init__(self,
                  game: "TurtleAdventureGame",
                  turtle: RawTurtle,
@@ -174,40 +243,25 @@ class Player(TurtleGameElement):
         pass
 
     def update(self) -> None:
-        # check if player has arrived home
-        if self.game.home.contains(self.x, self.y):
-            self.game.game_over_win()
-        turtle = self.__turtle
         waypoint = self.game.waypoint
-        if self.game.waypoint.is_active:
-            turtle.setheading(turtle.towards(waypoint.x, waypoint.y))
-            turtle.forward(self.speed)
-            if turtle.distance(waypoint.x, waypoint.y) < self.speed:
+        if waypoint.is_active:
+            x, y = self.x, self.y
+            dx = waypoint.x - x
+            dy = waypoint.y - y
+            speed = self.speed
+            dist_sq = dx*dx + dy*dy
+            if dist_sq <= speed*speed:
+                # close enough to step right onto the waypoint
+                self.x, self.y = waypoint.x, waypoint.y
                 waypoint.deactivate()
+            else:
+                self.__turtle.setheading(math.degrees(math.atan2(dy, dx)))
+                scale = speed / math.sqrt(dist_sq)
+                self.x, self.y = x + dx*scale, y + dy*scale
 
     def render(self) -> None:
+        # the location is kept in Python and only synced to the turtle here
         self.__turtle.goto(self.x, self.y)
-        self.__turtle.getscreen().update()
-
-    # override original property x's getter/setter to use turtle's methods
-    # instead
-    @property
-    def x(self) -> float:
-        return self.__turtle.xcor()
-
-    @x.setter
-    def x(self, val: float) -> None:
-        self.__turtle.setx(val)
-
-    # override original property y's getter/setter to use turtle's methods
-    # instead
-    @property
-    def y(self) -> float:
-        return self.__turtle.ycor()
-
-    @y.setter
-    def y(self, val: float) -> None:
-        self.__turtle.sety(val)
 
 
 class Enemy(TurtleGameElement):
@@ -215,6 +269,8 @@ class Enemy(TurtleGameElement):
     Define an abstract enemy for the Turtle's adventure game
     """
 
+    __slots__ = ("__size", "__color", "__speed", "_half", "_half_sq", "_rx", "_ry")
+
     def __init__(self,
                  game: "TurtleAdventureGame",
                  size: int,
@@ -223,6 +279,11 @@ class Enemy(TurtleGameElement):
         self.__size = size
         self.__color = color
         self.__speed: int
+        self._half: float = size/2
+        self._half_sq: float = self._half*self._half
+        # location at which the enemy's canvas item was last rendered
+        self._rx: float = 0
+        self._ry: float = 0
 
     @property
     def size(self) -> float:
@@ -252,15 +313,40 @@ class Enemy(TurtleGameElement):
         """
         self.__speed = speed
 
-    def hits_player(self):
+    def hits(self, px: float, py: float) -> bool:
+        """
+        Check whether the enemy is hitting the point (px, py)
+        """
+        half = self._half
+        return abs(self.x - px) < half and abs(self.y - py) < half
+
+    def _hits_circle(self, px: float, py: float) -> bool:
+        """
+        Check whether the point (px, py) lies within the circle inscribed in
+        the enemy's bounding box; round enemies use this as their hits()
+        """
+        dx = self.x - px
+        dy = self.y - py
+        return dx*dx + dy*dy < self._half_sq
+
+    def create_item(self, image: ImageTk.PhotoImage) -> int:
         """
-        Check whether the enemy is hitting the player
+        Get a canvas image item at (0, 0) to represent the enemy, possibly
+        recycled from a previously deleted enemy
         """
-        return (
-            (self.x - self.size/2 < self.game.player.x < self.x + self.size/2)
-            and
-            (self.y - self.size/2 < self.game.player.y < self.y + self.size/2)
-        )
+        self._rx = self._ry = 0
+        return self.game.acquire_image_item(image)
+
+    def move_item(self, item_id: int) -> None:
+        """
+        Move the enemy's canvas item by how far the enemy has moved since the
+        last render, skipping the call to Tk if it has not moved at all
+        """
+        dx = self.x - self._rx
+        dy = self.y - self._ry
+        if dx or dy:
+            self.canvas.move(item_id, dx, dy)
+            self._rx, self._ry = self.x, self.y
 
 
 class DemoEnemy(Enemy):
@@ -268,6 +354,10 @@ class DemoEnemy(Enemy):
     Demo enemy
     """
 
+    __slots__ = ("__x_state", "__y_state", "__id")
+
+    hits = Enemy._hits_circle
+
     def __init__(self,
                  game: "TurtleAdventureGame",
                  size: int,
@@ -277,25 +367,18 @@ class DemoEnemy(Enemy):
         self.__y_state = self.state_move_down
 
     def create(self) -> None:
-        self.__id = self.canvas.create_oval(0, 0, 0, 0,
-                                       fill=self.color)
+        self.__id = self.create_item(_shape_sprite("oval", self.size, self.color))
         self.speed = random.randint(1,5)
 
     def update(self) -> None:
         self.__x_state()
         self.__y_state()
-        if self.hits_player():
-            self.game.game_over_lose()
 
     def render(self) -> None:
-        self.canvas.coords(self.__id,
-                           self.x-self.size/2,
-                           self.y-self.size/2,
-                           self.x+self.size/2,
-                           self.y+self.size/2)
+        self.move_item(self.__id)
 
     def delete(self) -> None:
-        self.canvas.delete(self.__id)
+        self.game.release_item(self.__id)
 
     def state_move_right(self):
         """
@@ -303,7 +386,7 @@ class DemoEnemy(Enemy):
         """
         self.x += self.speed
         if self.check_x_border():
-            self.speed *= random.choice([1,1.1])
+            self.speed *= _JITTER[random.random() < 0.5]
             self.__x_state = self.state_move_left
 
     def state_move_left(self):
@@ -312,7 +395,7 @@ class DemoEnemy(Enemy):
         """
         self.x -= self.speed
         if self.check_x_border():
-            self.speed *= random.choice([1,1.1])
+            self.speed *= _JITTER[random.random() < 0.5]
             self.__x_state = self.state_move_right
 
     def state_move_down(self):
@@ -321,7 +404,7 @@ class DemoEnemy(Enemy):
         """
         self.y += self.speed
         if self.check_y_border():
-            self.speed *= random.choice([1,1.1])
+            self.speed *= _JITTER[random.random() < 0.5]
             self.__y_state = self.state_move_up
 
     def state_move_up(self):
@@ -330,14 +413,14 @@ class DemoEnemy(Enemy):
         """
         self.y -= self.speed
         if self.check_y_border():
-            self.speed *= random.choice([1,1.1])
+            self.speed *= _JITTER[random.random() < 0.5]
             self.__y_state = self.state_move_down
 
     def check_x_border(self):
         """
         Check whether the enemy hit the horizontal border
         """
-        if self.x < 0 or self.x > self.canvas.winfo_width():
+        if self.x < 0 or self.x > self.game.canvas_width:
             return True
         return False
 
@@ -345,7 +428,7 @@ class DemoEnemy(Enemy):
         """
         Checl whether the enemy hit the vertical border
         """
-        if self.y < 0 or self.y > self.canvas.winfo_height():
+        if self.y < 0 or self.y > self.game.canvas_height:
             return True
         return False
 
@@ -353,6 +436,10 @@ class RandomWalkEnemy(Enemy):
     """
     Enemy that set random waypoint and move to it
     """
+    __slots__ = ("__destination", "__id")
+
+    hits = Enemy._hits_circle
+
     def __init__(self,
                  game: "TurtleAdventureGame",
                  size: int,
@@ -364,184 +451,103 @@ class RandomWalkEnemy(Enemy):
         """
         Generate a random destination
         """
-        return (random.randint(0,self.canvas.winfo_width()),
-                random.randint(0,self.canvas.winfo_height()))
-
-    def update_x(self):
-        """
-        Update the enemy's x coordinate
-        """
-        if self.__destination[0] > self.x:
-            self.x += min(self.speed, self.__destination[0] - self.x)
-        else:
-            self.x -= min(self.speed, self.x - self.__destination[0])
-
-    def update_y(self):
-        """
-        Update the enemy's y coordinate
-        """
-        if self.__destination[1] > self.y:
-            self.y += min(self.speed, self.__destination[1] - self.y)
-        else:
-            self.y -= min(self.speed, self.y - self.__destination[1])
+        return (random.randint(0,self.game.canvas_width),
+                random.randint(0,self.game.canvas_height))
 
     def create(self) -> None:
-        self.__id = self.canvas.create_oval(0, 0, 0, 0,
-                                       fill=self.color)
+        self.__id = self.create_item(_shape_sprite("oval", self.size, self.color))
         self.speed = random.randint(1,5)
-        self.x = random.randint(0, self.canvas.winfo_width())
-        self.y = random.randint(0, self.canvas.winfo_height())
+        self.x = random.randint(0, self.game.canvas_width)
+        self.y = random.randint(0, self.game.canvas_height)
 
     def update(self) -> None:
-        if self.__destination[0] == self.x and self.__destination[1] == self.y:
-            self.__destination = self.gen_dest()
-        self.update_x()
-        self.update_y()
-        if self.hits_player():
-            self.game.game_over_lose()
+        x, y, speed = self.x, self.y, self.speed
+        dest_x, dest_y = self.__destination
+        if dest_x == x and dest_y == y:
+            self.__destination = dest_x, dest_y = self.gen_dest()
+        self.x = _step_towards(x, dest_x, speed)
+        self.y = _step_towards(y, dest_y, speed)
 
     def render(self) -> None:
-        self.canvas.coords(self.__id,
-                           self.x-self.size/2,
-                           self.y-self.size/2,
-                           self.x+self.size/2,
-                           self.y+self.size/2)
+        self.move_item(self.__id)
 
     def delete(self) -> None:
-        self.canvas.delete(self.__id)
+        self.game.release_item(self.__id)
 
 class ChasingEnemy(Enemy):
     """
     Enemy that chase the player by setting the player's location as the waypoint
     """
-    def __init__(self,
-                 game: "TurtleAdventureGame",
-                 size: int,
-                 color: str):
-        super().__init__(game, size, color)
-        self.__player_loc = self.gen_player_loc()
-
-    def gen_player_loc(self):
-        """
-        Get the player's location
-        """
-        return (self.game.player.x, self.game.player.y)
-
-    def update_x(self):
-        """
-        Update the enemy's x coordinate
-        """
-        if self.__player_loc[0] > self.x:
-            self.x += min(self.speed, self.__player_loc[0] - self.x)
-        else:
-            self.x -= min(self.speed, self.x - self.__player_loc[0])
-
-    def update_y(self):
-        """
-        Update the enemy's y coordinate
-        """
-        if self.__player_loc[1] > self.y:
-            self.y += min(self.speed, self.__player_loc[1] - self.y)
-        else:
-            self.y -= min(self.speed, self.y - self.__player_loc[1])
+    __slots__ = ("__id",)
 
     def create(self) -> None:
-        self.__id = self.canvas.create_rectangle(0, 0, 0, 0,
-                                                 fill=self.color)
+        self.__id = self.create_item(_shape_sprite("rectangle", self.size, self.color))
         self.speed = 2
-        self.x = random.randint(self.canvas.winfo_width()/2, self.canvas.winfo_width())
-        self.y = random.randint(0, self.canvas.winfo_height())
+        self.x = random.randint(self.game.canvas_width//2, self.game.canvas_width)
+        self.y = random.randint(0, self.game.canvas_height)
 
     def update(self) -> None:
-        self.__player_loc = self.gen_player_loc()
-        self.update_x()
-        self.update_y()
-        if self.hits_player():
-            self.game.game_over_lose()
+        player = self.game.player
+        speed = self.speed
+        self.x = _step_towards(self.x, player.x, speed)
+        self.y = _step_towards(self.y, player.y, speed)
 
     def render(self) -> None:
-        self.canvas.coords(self.__id,
-                           self.x-self.size/2,
-                           self.y-self.size/2,
-                           self.x+self.size/2,
-                           self.y+self.size/2)
+        self.move_item(self.__id)
 
     def delete(self) -> None:
-        self.canvas.delete(self.__id)
+        self.game.release_item(self.__id)
 
 class FencingEnemy(Enemy):
     """
     Enemy that guards the home by rotating around it
     """
+    __slots__ = ("__travelled", "__id")
+
     def __init__(self,
                  game: "TurtleAdventureGame",
                  size: int,
                  color: str):
         super().__init__(game, size, color)
-        self.__state = self.move_right_state
+        # distance walked along the fence, counted from its bottom-right
+        # corner in the order of _FENCE_SIDES
+        self.__travelled: float = 0
 
     def create(self) -> None:
-        self.__id = self.canvas.create_rectangle(0, 0, 0, 0,
-                                               fill=self.color)
+        self.__id = self.create_item(_shape_sprite("rectangle", self.size, self.color))
         self.speed = random.randint(1,3)
-        self.x = self.game.home.x + random.randint(18,22)
-        self.y = self.game.home.y + random.randint(18,22)
+        # start somewhere random along the fence so that enemies with the same
+        # speed do not patrol on top of each other
+        self.__travelled = random.random() * _FENCE_LAP
+        self.__place()
 
-    def move_right_state(self):
-        """
-        State for moving right around the home
-        """
-        if self.x < self.game.home.x + 20:
-            self.x += self.speed
-        else:
-            self.__state = self.move_up_state
-
-    def move_left_state(self):
-        """
-        State for moving left around the home
-        """
-        if self.x > self.game.home.x - 20:
-            self.x -= self.speed
-        else:
-            self.__state = self.move_down_state
-
-    def move_up_state(self):
-        """
-        State for moving up around the home
-        """
-        if self.y > self.game.home.y - 20:
-            self.y -= self.speed
-        else:
-            self.__state = self.move_left_state
-
-    def move_down_state(self):
+    def __place(self) -> None:
         """
-        State for moving down around the home
+        Put the enemy at the point on the fence given by the distance it has
+        travelled
         """
-        if self.y < self.game.home.y + 20:
-            self.y += self.speed
-        else:
-            self.__state = self.move_right_state
+        side, along = divmod(self.__travelled, 2*_FENCE_HALF)
+        corner_x, corner_y, dir_x, dir_y = _FENCE_SIDES[int(side)]
+        home = self.game.home
+        self.x = home.x + corner_x*_FENCE_HALF + dir_x*along
+        self.y = home.y + corner_y*_FENCE_HALF + dir_y*along
 
     def update(self) -> None:
-        self.__state()
-        if self.hits_player():
-            self.game.game_over_lose()
+        self.__travelled = (self.__travelled + self.speed) % _FENCE_LAP
+        self.__place()
 
     def render(self) -> None:
-        self.canvas.coords(self.__id,
-                           self.x-self.size/2,
-                           self.y-self.size/2,
-                           self.x+self.size/2,
-                           self.y+self.size/2)
+        self.move_item(self.__id)
 
     def delete(self) -> None:
-        self.canvas.delete(self.__id)
+        self.game.release_item(self.__id)
 
 class CrossEnemy(Enemy):
     """
     Enemy that travel in a cross shape from corner to corner
     """
+    __slots__ = ("__state", "__x_speed", "__y_speed", "__imgtk", "__id")
+
     def __init__(self,
                  game: "TurtleAdventureGame",
                  size: int,
@@ -550,30 +556,38 @@ class CrossEnemy(Enemy):
         self.__state = self.move_down_state
         self.x = 0
         self.y = 0
-        self.__x_speed = 0
-        self.__y_speed = 0
+        self.__x_speed: float = 0
+        self.__y_speed: float = 0
 
     def create(self) -> None:
-        self.__imgtk = ImageTk.PhotoImage(Image.open(
-            os.path.join(os.getcwd(), 'images','gauss-in-action-glyph.png')))
-        self.__id = self.canvas.create_image(self.x,self.y, image=self.__imgtk, anchor=tk.CENTER)
+        self.__imgtk = _file_sprite(
+            os.path.join(os.getcwd(), 'images','gauss-in-action-glyph.png'))
+        self.__id = self.create_item(self.__imgtk)
         self.speed = random.randint(10,15)
+        self.__start_leg(self.game.canvas_width, self.game.canvas_height)
+
+    def __start_leg(self, target_x: float, target_y: float) -> None:
+        """
+        Set the velocity for travelling in a straight line from the current
+        location to the target corner
+        """
+        delta_x = target_x - self.x
+        delta_y = target_y - self.y
+        scale = self.speed / math.hypot(delta_x, delta_y)
+        self.__x_speed = delta_x * scale
+        self.__y_speed = delta_y * scale
 
     def move_down_state(self):
         """
         State for moving down diagonally
         """
-        if self.canvas.winfo_height()-self.y >= 10:
-            delta_x = self.canvas.winfo_width() - self.x
-            delta_y = self.canvas.winfo_height() - self.y
-            hypotenuse = (delta_x**2 + delta_y**2)**0.5
-            self.__x_speed = self.speed * (delta_x/hypotenuse)
-            self.__y_speed = self.speed * (delta_y/hypotenuse)
+        if self.game.canvas_height-self.y >= 10:
             self.x += self.__x_speed
             self.y += self.__y_speed
         else:
             self.x = 0
-            self.y = self.canvas.winfo_height()
+            self.y = self.game.canvas_height
+            self.__start_leg(self.game.canvas_width, 0)
             self.__state = self.move_up_state
 
     def move_up_state(self):
@@ -581,28 +595,22 @@ class CrossEnemy(Enemy):
         State for moving up diagonally
         """
         if self.y >= 10:
-            delta_x = self.canvas.winfo_width() - self.x
-            delta_y = self.y
-            hypotenuse = (delta_x**2 + delta_y**2)**0.5
-            self.__x_speed = self.speed * (delta_x/hypotenuse)
-            self.__y_speed = self.speed * (delta_y/hypotenuse)
             self.x += self.__x_speed
-            self.y -= self.__y_speed
+            self.y += self.__y_speed
         else:
             self.x = 0
             self.y = 0
+            self.__start_leg(self.game.canvas_width, self.game.canvas_height)
             self.__state = self.move_down_state
 
     def update(self) -> None:
         self.__state()
-        if self.hits_player():
-            self.game.game_over_lose()
 
     def render(self) -> None:
-        self.canvas.coords(self.__id,self.x,self.y)
+        self.move_item(self.__id)
 
     def delete(self) -> None:
-        self.canvas.delete(self.__id)
+        self.game.release_item(self.__id)
 
 class EnemyGenerator:
     """
@@ -615,7 +623,7 @@ class EnemyGenerator:
         self.__level: int = level
         self.__game.after(100, self.create_enemy)
         for _ in range(3):
-            self.__game.after(10000, self.create_chasing, level/4)
+            self.__game.after(10000, self.create_chasing, (level + 3) // 4)
 
     @property
     def game(self) -> "TurtleAdventureGame":
@@ -644,9 +652,8 @@ class EnemyGenerator:
         """
         Create RandomWalkEnemy based on the game level
         """
-        for _ in range(2*self.game.level-1):
-            new_enemy = RandomWalkEnemy(self.__game, 15, 'blue')
-            self.game.add_element(new_enemy)
+        self.game.add_enemies([RandomWalkEnemy(self.__game, 15, 'blue')
+                               for _ in range(2*self.game.level-1)])
 
     def create_chasing(self, num=None) -> None:
         """
@@ -654,25 +661,22 @@ class EnemyGenerator:
         """
         if not num:
             num = self.__level
-        for _ in range(math.ceil(num/3)):
-            new_enemy = ChasingEnemy(self.__game, 20, 'red')
-            self.game.add_element(new_enemy)
+        self.game.add_enemies([ChasingEnemy(self.__game, 20, 'red')
+                               for _ in range((num + 2) // 3)])
 
     def create_fencing(self) -> None:
         """
         Create FencingEnemy based on the game level
         """
-        for _ in range(math.ceil(self.game.level/2)):
-            new_enemy = FencingEnemy(self.__game, 10, 'green')
-            self.game.add_element(new_enemy)
+        self.game.add_enemies([FencingEnemy(self.__game, 10, 'green')
+                               for _ in range((self.game.level + 1) // 2)])
 
     def create_cross(self) -> None:
         """
         Create CrossEnemy based on the game level
         """
-        for _ in range(3*self.game.level-2):
-            new_enemy = CrossEnemy(self.__game, 25, 'black')
-            self.game.add_element(new_enemy)
+        self.game.add_enemies([CrossEnemy(self.__game, 25, 'black')
+                               for _ in range(3*self.game.level-2)])
 
 
 class TurtleAdventureGame(Game): # pylint: disable=too-many-ancestors
@@ -685,10 +689,15 @@ class TurtleAdventureGame(Game): # pylint: disable=too-many-ancestors
         self.level: int = level
         self.screen_width: int = screen_width
         self.screen_height: int = screen_height
+        self.canvas_width: int = screen_width
+        self.canvas_height: int = screen_height
+        self.screen: TurtleScreen
         self.waypoint: Waypoint
         self.player: Player
         self.home: Home
         self.enemies: list[Enemy] = []
+        self.__enemy_reach: float = 0
+        self.__free_items: list[int] = []
         self.enemy_generator: EnemyGenerator
         super().__init__(parent)
 
@@ -697,6 +706,7 @@ class TurtleAdventureGame(Game): # pylint: disable=too-many-ancestors
         turtle = RawTurtle(self.canvas)
         # set turtle screen's origin to the top-left corner
         turtle.screen.setworldcoordinates(0, self.screen_height-1, self.screen_width-1, 0)
+        self.screen = turtle.screen
 
         self.waypoint = Waypoint(self)
         self.add_element(self.waypoint)
@@ -705,18 +715,87 @@ class TurtleAdventureGame(Game): # pylint: disable=too-many-ancestors
         self.player = Player(self, turtle)
         self.add_element(self.player)
         self.canvas.bind("<Button-1>", lambda e: self.waypoint.activate(e.x, e.y))
+        self.canvas.bind("<Configure>", self.__on_resize)
 
         self.enemy_generator = EnemyGenerator(self, level=self.level)
 
         self.player.x = 50
         self.player.y = self.screen_height//2
 
+    def __on_resize(self, event: tk.Event) -> None:
+        """
+        Keep track of the canvas size so that game elements do not have to
+        query Tk for it on every frame
+        """
+        self.canvas_width = event.width
+        self.canvas_height = event.height
+
     def add_enemy(self, enemy: Enemy) -> None:
         """
         Add a new enemy into the current game
         """
-        self.enemies.append(enemy)
-        self.add_element(enemy)
+        self.add_enemies([enemy])
+
+    def add_enemies(self, enemies: list[Enemy]) -> None:
+        """
+        Add a batch of new enemies into the current game
+        """
+        for enemy in enemies:
+            self.add_element(enemy)
+        self.enemies.extend(enemies)
+        self.__enemy_reach = max([self.__enemy_reach] + [e.size/2 for e in enemies])
+
+    def acquire_image_item(self, image: ImageTk.PhotoImage) -> int:
+        """
+        Get a canvas image item showing the given image at (0, 0), reusing a
+        released item when one is available
+        """
+        if self.__free_items:
+            item = self.__free_items.pop()
+            self.canvas.itemconfigure(item, image=image, state="normal")
+            self.canvas.coords(item, 0, 0)
+            return item
+        return self.canvas.create_image(0, 0, image=image, anchor=tk.CENTER)
+
+    def release_item(self, item: int) -> None:
+        """
+        Hide a canvas item obtained from acquire_image_item() and keep it for
+        reuse instead of deleting it
+        """
+        self.canvas.itemconfigure(item, state="hidden")
+        self.__free_items.append(item)
+
+    def check_enemy_hits(self) -> None:
+        """
+        Check all enemies against the player's current location and end the
+        game if any of them hits the player
+        """
+        px, py = self.player.x, self.player.y
+        reach = self.__enemy_reach
+        for enemy in self.enemies:
+            # no enemy is wider than the reach, so this cheap check rules out
+            # most of them before the exact per-enemy test
+            if abs(enemy.x - px) < reach and enemy.hits(px, py):
+                self.game_over_lose()
+                return
+
+    def check_game_over(self) -> None:
+        """
+        End the game if the player has arrived home or is hit by an enemy
+        """
+        if self.home.contains(self.player.x, self.player.y):
+            self.game_over_win()
+        else:
+            self.check_enemy_hits()
+
+    def post_animate(self) -> None:
+        # game over is only decided once all elements have been updated, so
+        # the game never stops in the middle of the update loop
+        if self.is_started:
+            self.check_game_over()
+        # turtle's tracer is off, so its drawing is flushed once per frame
+        # after every element has been rendered
+        self.screen.update()
 
     def game_over_win(self) -> None:
         """